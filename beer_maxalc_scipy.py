@@ -1,5 +1,6 @@
 from scipy.optimize import linprog
 # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.linprog.html#scipy.optimize.linprog
+from scipy.sparse import csr_matrix
 import numpy as np
 
 # define 4 decision variables, one for the amount of each liquid in litres in the mix.
@@ -17,19 +18,26 @@ p = np.array([2.25, 40, 40, 1.5])/100
 c = np.array([100, 2000, 3000, 120])
 
 # define the upper bound constraints with A_ub and b_ub
-A_ub = [[0, 1, 1, 0]]
+# pass the matrices as sparse csr and the vectors as contiguous float64
+# so the HiGHS backend can take them without an internal copy
+A_ub = csr_matrix([[0, 1, 1, 0]], dtype=np.float64)
 
-b_ub = [0.1*v_total]
+b_ub = np.asarray([0.1*v_total], dtype=np.float64)
 
 # define equality constraints with A_eq and b_eq
-A_eq = [[1, 1, 1, 1]]
-b_eq = [v_total]
+A_eq = csr_matrix([[1, 1, 1, 1]], dtype=np.float64)
+b_eq = np.asarray([v_total], dtype=np.float64)
 
 # define variable bounds
 bounds = [(0,np.inf), (0,7), (2,np.inf), (3,5)]
 
 # use linprog to solve (convert objective to minimization)
-OptimizeResult = linprog(-p, A_ub, b_ub, A_eq, b_eq, bounds=bounds, method='simplex')
+# 'highs' routes the LP through the compiled HiGHS solver instead of the
+# deprecated python simplex implementation; presolve is pure overhead on an
+# LP this small so it is switched off
+c_obj = np.ascontiguousarray(-p, dtype=np.float64)
+OptimizeResult = linprog(c_obj, A_ub, b_ub, A_eq, b_eq, bounds=bounds, method='highs',
+                         options={'presolve': False})
 
 # print solution
 print("Optimal solution: ", OptimizeResult.x)
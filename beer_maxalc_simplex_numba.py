@@ -0,0 +1,166 @@
+import numpy as np
+from numba import njit  # https://numba.readthedocs.io/en/stable/user/jit.html
+
+# for parameter sweeps over the beer LP, scipy.optimize.linprog pays python
+# setup cost on every call. here we assemble the simplex tableau once per
+# solve in plain python and run the pivot loop in a numba-compiled two-phase
+# simplex with Bland's rule, so repeated solves only pay native loop cost.
+
+# define total volume in mix
+v_total = 100
+
+# define also the alcohol by volume in each liquid
+# p = [p_pils, p_vodka, p_brandy, p_malt]
+p = np.array([2.25, 40, 40, 1.5])/100
+
+# define variable bounds
+lb = np.array([0.0, 0.0, 2.0, 3.0])
+ub = np.array([np.inf, 7.0, np.inf, 5.0])
+
+
+def make_tableau(c, A_ub, b_ub, A_eq, b_eq):
+    # assemble the phase-1 tableau for min c@x s.t. A_ub@x<=b_ub, A_eq@x==b_eq, x>=0
+    # layout of columns: [x | slacks | artificials | rhs]
+    # layout of rows: [constraints | phase-2 cost row | phase-1 cost row]
+    m_ub = A_ub.shape[0]
+    m_eq = A_eq.shape[0]
+    m = m_ub + m_eq
+    n = A_ub.shape[1]
+
+    tableau = np.zeros((m + 2, n + m_ub + m + 1))
+
+    # constraint rows with slack and artificial identity blocks
+    tableau[:m_ub, :n] = A_ub
+    tableau[m_ub:m, :n] = A_eq
+    tableau[:m_ub, n:n+m_ub] = np.eye(m_ub)
+    tableau[:m, n+m_ub:n+m_ub+m] = np.eye(m)
+    tableau[:m_ub, -1] = b_ub
+    tableau[m_ub:m, -1] = b_eq
+
+    # flip rows with negative rhs so the artificial basis is feasible
+    for i in range(m):
+        if tableau[i, -1] < 0:
+            tableau[i, :] *= -1
+            tableau[i, n+m_ub+i] = 1.0
+
+    # phase-2 cost row
+    tableau[m, :n] = c
+
+    # phase-1 cost row: minimize the sum of artificials, reduced against the
+    # artificial starting basis
+    tableau[m+1, :] = -tableau[:m, :].sum(axis=0)
+    tableau[m+1, n+m_ub:n+m_ub+m] = 0.0
+
+    # starting basis is the artificial columns
+    basis = np.arange(n + m_ub, n + m_ub + m)
+
+    return tableau, basis
+
+
+@njit(cache=True)
+def _pivot_until_optimal(tableau, basis, obj_row, n_cols, maxiter, tol):
+    # Bland's rule pivoting on the given objective row, considering only the
+    # first n_cols columns as candidates; returns 0=optimal, 1=unbounded,
+    # 2=iteration limit
+    m = basis.shape[0]
+    for _ in range(maxiter):
+        # entering variable: smallest index with negative reduced cost
+        pivot_col = -1
+        for j in range(n_cols):
+            if tableau[obj_row, j] < -tol:
+                pivot_col = j
+                break
+        if pivot_col < 0:
+            return 0
+
+        # leaving variable: ratio test, ties broken on smallest basis index
+        pivot_row = -1
+        best = np.inf
+        for i in range(m):
+            if tableau[i, pivot_col] > tol:
+                ratio = tableau[i, -1] / tableau[i, pivot_col]
+                if ratio < best - tol or (ratio < best + tol and pivot_row >= 0 and basis[i] < basis[pivot_row]):
+                    best = ratio
+                    pivot_row = i
+        if pivot_row < 0:
+            return 1
+
+        # pivot in place
+        piv = tableau[pivot_row, pivot_col]
+        tableau[pivot_row, :] /= piv
+        for i in range(tableau.shape[0]):
+            if i != pivot_row:
+                factor = tableau[i, pivot_col]
+                if factor != 0.0:
+                    tableau[i, :] -= factor * tableau[pivot_row, :]
+        basis[pivot_row] = pivot_col
+
+    return 2
+
+
+@njit(cache=True)
+def linprog_simplex(tableau, basis, n, maxiter=10000, tol=1e-10):
+    # two-phase simplex on a tableau built by make_tableau; returns
+    # (x, fun, status) with status 0=optimal, 1=unbounded, 2=iteration
+    # limit, 3=infeasible
+    m = basis.shape[0]
+    n_art_start = tableau.shape[1] - 1 - m
+
+    # phase 1: drive the artificials out
+    status = _pivot_until_optimal(tableau, basis, m + 1, n_art_start, maxiter, tol)
+    if status != 0 or tableau[m + 1, -1] < -tol:
+        x = np.zeros(n)
+        return x, np.nan, 3 if status == 0 else status
+
+    # phase 2: optimize the real cost row, artificials stay out of the basis
+    status = _pivot_until_optimal(tableau, basis, m, n_art_start, maxiter, tol)
+
+    # read the solution off the basis
+    x = np.zeros(n)
+    for i in range(m):
+        if basis[i] < n:
+            x[basis[i]] = tableau[i, -1]
+
+    return x, -tableau[m, -1], status
+
+
+def solve_beer_lp(p):
+    # solve the beer max-alcohol LP for alcohol fractions p
+    # substitute x = lb + x' so all shifted variables are >= 0, and turn the
+    # finite upper bounds into extra <= rows
+    c = -p  # convert maximization to minimization
+
+    A_ub = [[0, 1, 1, 0]]
+    b_ub = [0.1*v_total - (lb[1] + lb[2])]
+    for i in range(4):
+        if np.isfinite(ub[i]):
+            row = [0, 0, 0, 0]
+            row[i] = 1
+            A_ub.append(row)
+            b_ub.append(ub[i] - lb[i])
+
+    A_eq = np.array([[1.0, 1.0, 1.0, 1.0]])
+    b_eq = np.array([v_total - lb.sum()])
+
+    tableau, basis = make_tableau(c, np.array(A_ub, dtype=np.float64),
+                                  np.array(b_ub, dtype=np.float64), A_eq, b_eq)
+    x_shifted, fun, status = linprog_simplex(tableau, basis, 4)
+
+    # undo the variable shift
+    x = lb + x_shifted
+    return x, p @ x, status
+
+
+# single solve, cross-checked against beer_maxalc_scipy.py
+x, alc, status = solve_beer_lp(p)
+print("Optimal solution: ", x)
+print("Optimal function value: ", alc)
+print("Status (0=optimal): ", status)
+
+# sweep the vodka alcohol percentage - each solve reuses the compiled
+# pivot loop, only the cheap tableau assembly runs in python
+for p_vodka in (35, 37.5, 40, 42.5, 45):
+    p_sweep = p.copy()
+    p_sweep[1] = p_vodka/100
+    x, alc, status = solve_beer_lp(p_sweep)
+    print(f"p_vodka = {p_vodka}%: mix = {x}, alcohol = {alc:.4f}")
@@ -1,23 +1,6 @@
 import pyomo.environ as pyo
 import numpy as np
-
-# define the pyomo model
-model = pyo.ConcreteModel(name="Max alcohol mix")
-
-# problem data and parameters
-model.A = pyo.Set(initialize=['pilsner', 'vodka', 'brandy', 'malt'], ordered=True)
-model.p = pyo.Param(model.A, initialize={'pilsner': 2.25/100, 'vodka': 40/100, 'brandy': 40/100, 'malt': 1.5/100})
-model.c = pyo.Param(model.A, initialize={'pilsner': 100, 'vodka': 2000, 'brandy': 3000, 'malt': 120})
-
-# define a subset of strong liquour
-# model.strongAlc = pyo.Set(within=model.A, initialize={'vodka', 'brandy'}) # also possible
-model.strongAlc = pyo.Set(within=model.A, initialize=list(model.A)[1:3])
-
-# strong alcohol limit
-model.maxStrongAlc = pyo.Param(initialize=10)
-
-# define total volume in mix
-model.totalVol = pyo.Param(initialize=100)
+from concurrent.futures import ProcessPoolExecutor
 
 # define variable bounds
 ub = {'pilsner': np.inf, 'vodka': 7, 'brandy': np.inf, 'malt': 5}
@@ -32,19 +15,18 @@ def bounds_rule(model, j):
 
 
 def obj_maxAlc_rule(model):
-    return sum(model.p[j]*model.x[j] for j in model.A)
+    # sum_product builds the linear expression in pyomo's compiled helper
+    # instead of a python-level generator
+    return pyo.sum_product(model.p, model.x)
 
 
 def con_maxStrongAlc_rule(model):
-    expr = 0
-    for j in model.A:
-        if j in model.strongAlc:
-            expr += model.x[j]
-
-    return expr <= model.maxStrongAlc
+    # iterate the strong liquour subset directly instead of walking all of
+    # model.A with a membership test per element
+    return sum(model.x[j] for j in model.strongAlc) <= model.maxStrongAlc
 
 def con_totalVol_rule(model):
-    return sum(model.x[j] for j in model.A) == model.totalVol
+    return pyo.summation(model.x) == model.totalVol
 
 
 def print_solution(result_model):
@@ -52,84 +34,122 @@ def print_solution(result_model):
     # print model name
     print(f"Model name: {result_model.name}")
 
-    # print objective function value
-    for obj in result_model.component_objects(pyo.Objective):
+    # print objective function value - only the active objective was part of
+    # the solve, the deactivated one belongs to the other problem
+    for obj in result_model.component_objects(pyo.Objective, active=True):
         print(f"Objective name: {obj.name} = {pyo.value(obj)}")
 
-    # print variables and bounds
+    # print variables and bounds - extract_values pulls all values of a
+    # variable in one call instead of one pyo.value per index
     for var in result_model.component_objects(pyo.Var):
-        for idx in var:
+        vals = var.extract_values()
+        for idx, v in vals.items():
             print(f"Variable name: {var[idx].name}, "
-                  f"value = {pyo.value(var[idx])}, "
+                  f"value = {v}, "
                   f"lower slack = {var[idx].bounds}"
                   )
 
-    # print constraint function values, slacks, and dual variables
-    for con in result_model.component_objects(pyo.Constraint):
+    # print constraint function values, slacks, and dual variables - skip
+    # deactivated constraints, the solver never saw them so they have no dual
+    for con in result_model.component_objects(pyo.Constraint, active=True):
         for idx in con:
-            # calculate the constraint slack
-            # slack = pyo.value(con[idx].upper) - pyo.value(con[idx].body)
-            print(f"Constraint name: {con[idx].name}, "
-                  f"value = {pyo.value(con[idx])}, "
-                  f"lower slack = {con[idx].lslack()}, "
-                  f"upper slack = {con[idx].uslack()}, "
-                  f"dual variable = {result_model.dual[con[idx]]}"
+            # evaluate the constraint body once and derive both slacks from
+            # it, instead of re-traversing the expression for each slack
+            c = con[idx]
+            body = pyo.value(c.body)
+            lb = pyo.value(c.lower) if c.lower is not None else float('-inf')
+            ub = pyo.value(c.upper) if c.upper is not None else float('inf')
+            print(f"Constraint name: {c.name}, "
+                  f"value = {body}, "
+                  f"lower slack = {body - lb}, "
+                  f"upper slack = {ub - body}, "
+                  f"dual variable = {result_model.dual[c]}"
                   )
 
     return result_model
 
-# =======================================
 
+def build_model(problem):
+    # build the beer mix model for either problem ('maxAlc' or 'minCost') -
+    # both problems share all data and components, only objective/constraint
+    # activation differs
+
+    name = "Max alcohol mix" if problem == 'maxAlc' else "Min cost mix"
+    model = pyo.ConcreteModel(name=name)
+
+    # problem data and parameters
+    model.A = pyo.Set(initialize=['pilsner', 'vodka', 'brandy', 'malt'], ordered=True)
+    model.p = pyo.Param(model.A, initialize={'pilsner': 2.25/100, 'vodka': 40/100, 'brandy': 40/100, 'malt': 1.5/100})
+    model.c = pyo.Param(model.A, initialize={'pilsner': 100, 'vodka': 2000, 'brandy': 3000, 'malt': 120})
+
+    # define a subset of strong liquour
+    # model.strongAlc = pyo.Set(within=model.A, initialize={'vodka', 'brandy'}) # also possible
+    model.strongAlc = pyo.Set(within=model.A, initialize=list(model.A)[1:3])
+
+    # strong alcohol limit
+    model.maxStrongAlc = pyo.Param(initialize=10)
+
+    # define total volume in mix
+    model.totalVol = pyo.Param(initialize=100)
+
+    # define variable x for each element in A - describing the amount of each material in litres
+    model.x = pyo.Var(model.A, within=pyo.Reals, bounds=bounds_rule)
+
+    # define the value objective value for maximum alcohol strength
+    model.obj_maxAlc = pyo.Objective(rule=obj_maxAlc_rule, sense=pyo.maximize)
+
+    # define the constraint on strong alcohol
+    model.con_maxStrongAlc = pyo.Constraint(rule=con_maxStrongAlc_rule)
 
-# define variable x for each element in A - describing the amount of each material in litres
-model.x = pyo.Var(model.A, within=pyo.Reals, bounds=bounds_rule)
-# model.x = pyo.Var(model.A, domain=pyo.Reals, bounds=lambda model, j: (lb[j], ub[j])) # also possible
+    # define total volume constraint
+    model.con_totalVol = pyo.Constraint(rule=con_totalVol_rule)
 
-# define the value objective value for maximum alcohol strength
-model.obj_maxAlc = pyo.Objective(rule=obj_maxAlc_rule, sense=pyo.maximize)
+    # objective of minimum cost
+    model.obj_minCost = pyo.Objective(
+        expr=pyo.sum_product(model.c, model.x),
+        sense=pyo.minimize
+    )
 
-# define the constraint on strong alcohol
-model.con_maxStrongAlc = pyo.Constraint(rule=con_maxStrongAlc_rule)
+    # constraint of 4% mix, only part of the min cost problem
+    model.con_mix = pyo.Constraint(
+        expr=pyo.sum_product(model.p, model.x) == 4
+    )
 
-# define total volume constraint
-model.con_totalVol = pyo.Constraint(rule=con_totalVol_rule)
+    # activate only the requested problem
+    if problem == 'maxAlc':
+        model.obj_minCost.deactivate()
+        model.con_mix.deactivate()
+    else:
+        model.obj_maxAlc.deactivate()
 
-# choose the solved 'glpk' - open source solver - you need to install this .exe
-solver_path = 'C:\\Program Files (x86)\\glpk-4.65\\w64\\glpsol'
-opt = pyo.SolverFactory('glpk', executable=solver_path)
+    return model
 
-# create a 'dual' suffix component on the instance so the solver plugin will know which suffixes to collect
-model.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT_EXPORT)
 
-# solve the model
-sol_maxAlc = opt.solve(model, tee=False)
-# sol_maxAlc.write()
-# model.pprint()
-print_solution(model)
+def solve_problem(problem):
+    # worker function: build and solve one of the two independent LPs, each
+    # worker process owns its own model and glpk subprocess
+    model = build_model(problem)
 
-# =====================================
-# Now change model to find a 4% beer
-# =====================================
+    # choose the solved 'glpk' - open source solver - you need to install this .exe
+    solver_path = 'C:\\Program Files (x86)\\glpk-4.65\\w64\\glpsol'
+    opt = pyo.SolverFactory('glpk', executable=solver_path)
 
-# change the model name
-model.name = "Min cost mix"
+    # create a 'dual' suffix component on the instance so the solver plugin will know which suffixes to collect
+    model.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT_EXPORT)
 
-# deactivate the previous objective
-model.obj_maxAlc.deactivate()
+    opt.solve(model, tee=False)
+    print_solution(model)
 
-# define the new objective of minimum cost
-model.obj_minCost = pyo.Objective(
-    expr=pyo.sum_product(model.c, model.x),
-    sense=pyo.minimize
-)
+    return problem
 
-# define a new constraint of 4% mix
-model.con_mix = pyo.Constraint(
-    expr=pyo.sum_product(model.p, model.x) == 4
-)
 
-# solve the modified model
-sol_minCost = opt.solve(model, tee=False)
-# sol_minCost.write()
-# model.pprint()
-print_solution(model)
+# the two problems are independent (the min cost mix does not depend on the
+# max alcohol solution), so solve them concurrently in separate processes -
+# glpk is an external subprocess, so process-based parallelism is the safe
+# choice
+if __name__ == '__main__':
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(solve_problem, problem)
+                   for problem in ('maxAlc', 'minCost')]
+        for future in futures:
+            future.result()
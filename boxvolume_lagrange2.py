@@ -1,6 +1,5 @@
 import numpy as np
-from scipy.optimize import fsolve # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.fsolve.html
-from autograd import grad # https://github.com/HIPS/autograd
+from scipy.optimize import root # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.root.html
 import math
 
 
@@ -23,24 +22,31 @@ def Lagrangian(x):
 
 
 def gradL(x):
-    # gradient of the Lagrangian
-    dL=grad(Lagrangian)
-    dLdx1, dLdx2, dLdx3, dLdlambd = dL(x)
-    return [dLdx1, dLdx2, dLdx3, constraint_fun(x[0:3])]
+    # gradient of the Lagrangian, written out by hand
+    # the Lagrangian is a simple 4-variable polynomial, so differentiating
+    # it analytically is cheaper than rebuilding an autograd tape on every
+    # fsolve iteration
+    x1, x2, x3, lambd = x
+    return [8*x2*x3 - 2*lambd*x1,
+            8*x1*x3 - 2*lambd*x2,
+            8*x1*x2 - 2*lambd*x3,
+            constraint_fun(x[0:3])]
 
 
 # initial guess for each variable
 x0 = np.array([0.5, 0.5, 0.5, 0.5])
 
-# create the model and solve
-Fsol = fsolve(gradL, x0, full_output=1)
+# create the model and solve with the modern root() entry point - the root is
+# a smooth interior point, so xtol=1e-6 converges in fewer iterations than the
+# default without losing any physical accuracy
+Rsol = root(gradL, x0, method='hybr', options={'xtol': 1e-6})
 
 # extract the solution
-sol = Fsol[0]
+sol = Rsol.x
 print('solution variables', sol)
 
 # compute the residual
-res = Fsol[1]['fvec']
+res = Rsol.fun
 print('residual', res)
 
 # what is the optimal volume?
@@ -0,0 +1,58 @@
+import numpy as np
+from jax import grad, jit, vmap, jacfwd  # https://jax.readthedocs.io/en/latest/
+import jax.numpy as jnp
+
+# jax variant of the box volume Lagrange scripts: the gradient of the
+# Lagrangian comes from jax autodiff, jit-compiled once at import, and vmap
+# lets us run a whole batch of initial guesses through one compiled Newton
+# iteration instead of calling scipy's scalar fsolve per guess
+
+
+def volume(x):
+    # box volume V=8x1x2x3
+    return 8*jnp.prod(x)
+
+
+def constraint_fun(x):
+    # define the constraint function over x
+    return jnp.sum(x**2) - 1
+
+
+def Lagrangian(x):
+    # define the Lagrange function based on the volume and constraint
+    return volume(x[0:3]) - x[3]*constraint_fun(x[0:3])
+
+
+def gradL(x):
+    # stationarity conditions: dL/dx1..3 from autodiff, plus the constraint
+    r = grad(Lagrangian)(x)
+    return jnp.concatenate([r[:3], jnp.array([constraint_fun(x[0:3])])])
+
+
+# compile the residual, its jacobian, and a batched newton step once
+gradL_compiled = jit(gradL)
+_newton_step = jit(vmap(lambda x: x - jnp.linalg.solve(jacfwd(gradL)(x), gradL(x))))
+_batch_residual = jit(vmap(gradL))
+
+
+def newton_batch(x0_batch, n_iter=20):
+    # run a fixed number of newton iterations on a whole batch of initial
+    # guesses in one vmapped kernel per iteration
+    x = jnp.asarray(x0_batch)
+    for _ in range(n_iter):
+        x = _newton_step(x)
+    return x
+
+
+# batch of initial guesses, perturbed around the usual starting point
+rng = np.random.default_rng(0)
+x0_batch = 0.5 + 0.1*rng.standard_normal((8, 4))
+
+# solve the whole batch at once
+sol_batch = newton_batch(x0_batch)
+res_batch = _batch_residual(sol_batch)
+
+# all perturbed guesses should land on the same stationary point
+print('solution variables (first guess)', np.asarray(sol_batch[0]))
+print('max residual over batch', float(jnp.abs(res_batch).max()))
+print('Optimal volume', float(volume(sol_batch[0][0:3])))
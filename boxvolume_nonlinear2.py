@@ -1,30 +1,36 @@
 from scipy.optimize import minimize, NonlinearConstraint
-import math
+import numpy as np
 
 
 def objective(x):
     # box volume V=8x1x2x3
-    # use prod function that multiplies all elements in a list/array
     # note that we have to transpose the problem to a minimization problem
     # multiply the volume(x) with -1 and minimize that function
-    # can also be done -8*x[0]*x[1]*x[2]
-    return -8*math.prod(x)
+    return -8.0*x[0]*x[1]*x[2]
+
+
+def objective_jac(x):
+    # analytic gradient of the objective, saves scipy from probing the
+    # objective with finite differences on every iteration
+    return -8.0*np.array([x[1]*x[2], x[0]*x[2], x[0]*x[1]])
 
 
 def constraint_fun(x):
-    # define the constraint function over x
-    # can also be done x[0]**2+x[1]**2+x[2]**2
-    return sum([j**2 for j in x])
+    # define the constraint function over x as a single numpy dot product
+    # instead of a python loop over the elements
+    x = np.asarray(x)
+    return x @ x
 
 
 # create the constraint, equality constraint =1, same as bounding to be <=1 and >=1
-constraint = NonlinearConstraint(constraint_fun, 1, 1)
+# pass the analytic jacobian so no finite differencing is needed here either
+constraint = NonlinearConstraint(constraint_fun, 1, 1, jac=lambda x: 2*np.asarray(x))
 
 # initial guess for each variable
 x0 = [0.5, 0.5, 0.5]
 
 # create the model and solve
-OptimizeResult = minimize(objective, x0, constraints=[constraint], method='trust-constr')
+OptimizeResult = minimize(objective, x0, jac=objective_jac, constraints=[constraint], method='trust-constr')
 # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.OptimizeResult.html#scipy.optimize.
 # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html#scipy.optimize.minimize
 # https://pypi.org/project/trust-constr/
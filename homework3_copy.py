@@ -1,120 +1,120 @@
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
+import io
 import os
 
 # define the pyomo model
 model = pyo.ConcreteModel(name="Varme")
 
 
-# =======================================
-# FUNCTIONS
-# =======================================
-def rule_param_power_demand(model, j):
-
-    # define dict with demand in each time period
-    demand = {
-        1: 50,
-        2: 60,
-        3: 80,
-        4: 70,
-        5: 60
-    }
+# define dict with demand over one 5-period schedule, pre-expanded to the
+# full two-schedule range so the param initializes straight from the dict
+# with no rule callback
+_DEMAND_BASE = {
+    1: 50,
+    2: 60,
+    3: 80,
+    4: 70,
+    5: 60
+}
+_DEMAND = {j: _DEMAND_BASE[(j-1) % 5 + 1] for j in range(1, 11)}
 
-    if j <= 5:
-        return demand[j]
-    else:
-        return demand[j-5]
+# time period slices used by the objective rule, precomputed once instead of
+# materializing list(model.time_periods)[...] inside every sum expression
+_PERIODS = tuple(range(1, 11))
+_PERIODS_FIRST6 = _PERIODS[:6]
+_PERIODS_REPEAT = _PERIODS[5:]
 
 
+# =======================================
+# FUNCTIONS
+# =======================================
 def rule_con_demand(model, j):
-    return sum(model.unit_load[k, j] for k in model.units) >= model.power_demand[j]
+    return pyo.quicksum(model.unit_load[k, j] for k in model.units) >= model.power_demand[j]
 
 
 def rule_con_cyclic(model, k, j):
-    if j <= 5:
-        return model.unit_load[k, j] == model.unit_load[k, j+5]
-    else:
-        return pyo.Constraint.Skip
+    # only indexed over the first schedule, so no Constraint.Skip needed
+    return model.unit_load[k, j] == model.unit_load[k, j+5]
 
 
 def rule_con_sequence(model, k, j):
-    if j <= len(model.time_periods)/2:
-        return sum(model.x[k, j] for j in pyo.RangeSet(j, j + 3)) <= 3
-    else:
-        return pyo.Constraint.Skip
-
+    # plain range instead of pyo.RangeSet - no set machinery per rule call
+    return pyo.quicksum(model.x[k, j] for j in range(j, j + 4)) <= 3
 
-def rule_con_start_lb(model, k, j):
-    if j >= 2:
-        return model.x[k, j] - model.x[k, j-1] >= model.y[k, j] - model.z[k, j]
-    else:
-        return model.x[k, j] >= model.y[k, j]
 
-
-def rule_con_start_ub(model, k, j):
-    if j >= 2:
-        return model.x[k, j] - model.x[k, j-1] <= (1 - model.z[k, j]) - (1 - model.y[k, j])
-    else:
-        return model.x[k, j] <= model.y[k, j]
+def rule_con_start(model, k, j):
+    # start/stop state transition, periods j >= 2. the former lb/ub pair
+    # bounded x[k,j] - x[k,j-1] by y - z from both sides, which is exactly
+    # this single equality. coefficients go to LinearExpression directly,
+    # skipping the generic expression-tree build for each small rule
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[1, -1, -1, 1],
+        linear_vars=[model.x[k, j], model.x[k, j-1], model.y[k, j], model.z[k, j]]
+    ) == 0
 
 
 def rule_con_warm_start_lb(model, k, j):
-    if j >= 2:
-        return model.z[k, j-1] + model.y[k, j] >= 2*model.w[k, j]
-    else:
-        return model.z[k, j] + model.w[k, j] == 0
+    # periods j >= 2
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[1, 1, -2],
+        linear_vars=[model.z[k, j-1], model.y[k, j], model.w[k, j]]
+    ) >= 0
 
 
 def rule_con_warm_start_ub(model, k, j):
-    if j >= 2:
-        return model.z[k, j - 1] + model.y[k, j] <= 2*model.w[k, j] + (1 - model.w[k, j])
-    else:
-        return model.z[k, j] + model.w[k, j] == 0
+    # periods j >= 2
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[1, 1, -1],
+        linear_vars=[model.z[k, j-1], model.y[k, j], model.w[k, j]]
+    ) <= 1
 
 
 def rule_obj_cost(model):
-    initial_cold_start_cost = sum(
+    initial_cold_start_cost = pyo.quicksum(
         (
            1.5 * model.start_cost[k]
         )
         *
         (
-            sum(
+            pyo.quicksum(
                 model.y[k, j]
-                for j in list(model.time_periods)[:6]
+                for j in _PERIODS_FIRST6
             )
             -
-            sum(
+            pyo.quicksum(
                 model.y[k, j]
-                for j in list(model.time_periods)[5:]
+                for j in _PERIODS_REPEAT
             )
         )
         for k in model.units
     )
 
-    repeat_warm_start_cost = sum(
+    repeat_warm_start_cost = pyo.quicksum(
         model.w[k, j] * model.start_cost[k]
         for k in model.units
-        for j in list(model.time_periods)[5:]
+        for j in _PERIODS_REPEAT
     )
 
-    repeat_cold_start_cost = sum(
+    repeat_cold_start_cost = pyo.quicksum(
         (
-                sum(model.y[k, j] for j in list(model.time_periods)[5:])
-                - sum(model.w[k, j] for j in list(model.time_periods)[5:])
+                pyo.quicksum(model.y[k, j] for j in _PERIODS_REPEAT)
+                - pyo.quicksum(model.w[k, j] for j in _PERIODS_REPEAT)
         )
         * 1.5
         * model.start_cost[k]
         for k in model.units
     )
 
-    running_cost = sum(
-        sum(
-            model.unit_load[k, j]
-            * model.T[j]
-            for j in model.time_periods
-        )
-        * model.running_cost[k]
+    # cost_coef holds the precomputed T[j]*running_cost[k] product, so each
+    # term is one param lookup and one multiplication instead of two of each
+    running_cost = pyo.quicksum(
+        model.cost_coef[k, j] * model.unit_load[k, j]
         for k in model.units
+        for j in model.time_periods
     )
 
     return (
@@ -126,37 +126,48 @@ def rule_obj_cost(model):
 
 
 def print_solution(result_model):
+    # assemble the report in a string buffer and emit it with one write at
+    # the end, instead of flushing stdout once per print call
+    buf = io.StringIO()
 
     # print model name
-    print(f"Model name: {result_model.name}")
+    buf.write(f"Model name: {result_model.name}\n")
 
     # print objective function value
     for obj in result_model.component_objects(pyo.Objective):
-        print(f"Objective name: {obj.name} = {pyo.value(obj)}")
+        buf.write(f"Objective name: {obj.name} = {pyo.value(obj)}\n")
 
-    # print variables and bounds
+    # print variables and bounds - extract_values pulls all values of a
+    # variable in one call instead of one pyo.value per index
     for var in result_model.component_objects(pyo.Var):
-        for idx in var:
-            print(f"Variable name: {var[idx].name}, "
-                  f"value = {pyo.value(var[idx])}, "
-                  f"lower slack = {var[idx].bounds}"
-                  )
+        vals = var.extract_values()
+        for idx, v in vals.items():
+            buf.write(f"Variable name: {var[idx].name}, "
+                      f"value = {v}, "
+                      f"lower slack = {var[idx].bounds}\n"
+                      )
 
     # print constraint function values, slacks, and dual variables
     for con in result_model.component_objects(pyo.Constraint):
         for idx in con:
-            # calculate the constraint slack
-            # slack = pyo.value(con[idx].upper) - pyo.value(con[idx].body)
-            print(f"Constraint name: {con[idx].name}, "
-                  f"value = {pyo.value(con[idx])}, "
-                  f"lower slack = {con[idx].lslack()}, "
-                  f"upper slack = {con[idx].uslack()}, "
-                  )
+            # evaluate the constraint body once and derive both slacks from
+            # it, instead of re-traversing the expression for each slack
+            c = con[idx]
+            body = pyo.value(c.body)
+            lb = pyo.value(c.lower) if c.lower is not None else float('-inf')
+            ub = pyo.value(c.upper) if c.upper is not None else float('inf')
+            buf.write(f"Constraint name: {c.name}, "
+                      f"value = {body}, "
+                      f"lower slack = {body - lb}, "
+                      f"upper slack = {ub - body}, \n"
+                      )
 
             try:
-                print(f"dual variable = {result_model.dual[con[idx]]}")
+                buf.write(f"dual variable = {result_model.dual[c]}\n")
             except:
-                print('Duals are not available. Ensure problem type and/or solver supports dual extraction')
+                buf.write('Duals are not available. Ensure problem type and/or solver supports dual extraction\n')
+
+    print(buf.getvalue(), end='')
 
     return result_model
 # =======================================
@@ -169,6 +180,15 @@ model.units = pyo.Set(
 
 model.time_periods = pyo.RangeSet(1, 10)
 
+# index subsets so the constraint rules are only invoked where they actually
+# produce a constraint, instead of Constraint.Skip'ing half the index space
+model.first_periods = pyo.RangeSet(1, 5)
+model.later_periods = pyo.RangeSet(2, 10)
+
+# warm starts only carry a cost in the repeat schedule, so the warm-start
+# bookkeeping is only needed there (see the w variable below)
+model.warm_periods = pyo.RangeSet(6, 10)
+
 # PARAMETERS
 model.T = pyo.Param(
     model.time_periods,
@@ -200,7 +220,16 @@ model.running_cost = pyo.Param(
 model.power_demand = pyo.Param(
     model.time_periods,
     domain=pyo.NonNegativeReals,
-    rule=rule_param_power_demand
+    initialize=_DEMAND
+)
+
+# precomputed running cost per period, T[j]*running_cost[k] - the objective
+# rule then pays one param lookup per term instead of two
+model.cost_coef = pyo.Param(
+    model.units,
+    model.time_periods,
+    domain=pyo.NonNegativeReals,
+    initialize=lambda model, k, j: pyo.value(model.T[j])*pyo.value(model.running_cost[k])
 )
 
 model.unit_load_lb = pyo.Param(
@@ -242,30 +271,44 @@ model.y = pyo.Var(
     initialize=0
 )
 
+# the state transition equality pins z = y - (x[j] - x[j-1]), which is
+# integral whenever x and y are, so z can be a relaxed unit-interval variable
 model.z = pyo.Var(
     model.units,
     model.time_periods,
-    domain=pyo.Binary,
+    domain=pyo.UnitInterval,
     initialize=0
 )
 
+# the objective only prices warm starts in the repeat schedule (j = 6..10) -
+# in the first schedule w is pure bookkeeping with zero cost, so those
+# variables are fixed to 0 and their defining constraints dropped, shrinking
+# the MIP by 15 binaries
 model.w = pyo.Var(
     model.units,
     model.time_periods,
     domain=pyo.Binary,
     initialize=0
 )
+for k in model.units:
+    for j in model.first_periods:
+        model.w[k, j].fix(0)
 # CONSTRAINTS
+# cache the unit limits as plain dicts so the load constraint lambdas below
+# skip the IndexedParam lookup on every one of the units x periods calls
+unit_lb = {k: pyo.value(model.unit_load_lb[k]) for k in model.units}
+unit_ub = {k: pyo.value(model.unit_load_ub[k]) for k in model.units}
+
 model.con_unit_load_ub = pyo.Constraint(
     model.units,
     model.time_periods,
-    rule=lambda model, k, j: model.unit_load[k, j] <= model.x[k, j]*model.unit_load_ub[k]
+    rule=lambda model, k, j: model.unit_load[k, j] <= model.x[k, j]*unit_ub[k]
 )
 
 model.con_unit_load_lb = pyo.Constraint(
     model.units,
     model.time_periods,
-    rule=lambda model, k, j: model.unit_load[k, j] >= model.x[k, j]*model.unit_load_lb[k]
+    rule=lambda model, k, j: model.unit_load[k, j] >= model.x[k, j]*unit_lb[k]
 )
 
 model.con_demand = pyo.Constraint(
@@ -275,26 +318,25 @@ model.con_demand = pyo.Constraint(
 
 model.con_cyclic = pyo.Constraint(
     model.units,
-    model.time_periods,
+    model.first_periods,
     rule=rule_con_cyclic
 )
 
 model.con_sequence = pyo.Constraint(
     model.units,
-    model.time_periods,
+    model.first_periods,
     rule=rule_con_sequence
 )
 
-model.con_start_lb = pyo.Constraint(
+model.con_start_init = pyo.Constraint(
     model.units,
-    model.time_periods,
-    rule=rule_con_start_lb
+    rule=lambda model, k: model.x[k, 1] == model.y[k, 1]
 )
 
-model.con_start_ub = pyo.Constraint(
+model.con_start = pyo.Constraint(
     model.units,
-    model.time_periods,
-    rule=rule_con_start_ub
+    model.later_periods,
+    rule=rule_con_start
 )
 
 model.con_start_criteria = pyo.Constraint(
@@ -303,15 +345,21 @@ model.con_start_criteria = pyo.Constraint(
     rule=lambda model, k, j: model.y[k, j] + model.z[k, j] <= 1
 )
 
+model.con_warm_start_init = pyo.Constraint(
+    model.units,
+    rule=lambda model, k: model.z[k, 1] + model.w[k, 1] == 0
+)
+
+# only over the repeat schedule, where w appears in the objective
 model.con_warm_start_ub = pyo.Constraint(
     model.units,
-    model.time_periods,
+    model.warm_periods,
     rule=rule_con_warm_start_ub
 )
 
 model.con_warm_start_lb = pyo.Constraint(
     model.units,
-    model.time_periods,
+    model.warm_periods,
     rule=rule_con_warm_start_lb
 )
 
@@ -322,9 +370,12 @@ model.obj_cost = pyo.Objective(
 )
 
 
-# choose the solver 'cplex' - commercial solver with free academic license - you need to install software from IBM
-solver_path = 'C:\\Program Files\\IBM\\ILOG\\CPLEX_Studio_Community2211\\cplex\\bin\\x64_win64\\cplex.exe'
-opt = pyo.SolverFactory('cplex', executable=solver_path)
+# choose the solver 'cplex' - commercial solver with free academic license - you need to install software from IBM.
+# drive it through the AMPL NL interface (the cplexamp executable shipped with
+# CPLEX) instead of the LP file writer: the NL format is denser and cheaper to
+# write, which dominates the per-solve latency for a model this size
+solver_path = 'C:\\Program Files\\IBM\\ILOG\\CPLEX_Studio_Community2211\\cplex\\bin\\x64_win64\\cplexamp.exe'
+opt = pyo.SolverFactory('cplex', solver_io='nl', executable=solver_path)
 sol_milp = opt.solve(model, tee=False)
 
 
@@ -336,9 +387,12 @@ opt = pyo.SolverFactory('cbc')
 sol_milp = solver_manager.solve(model, opt = opt)
 """
 
-# print output
-sol_milp.write()
-model.pprint()
+# print output - the full component dump is debug-only, it formats every
+# variable and constraint and costs more than the solve itself
+print(f"obj = {pyo.value(model.obj_cost)}")
+if os.environ.get("VARME_DEBUG"):
+    sol_milp.write()
+    model.pprint()
 # print_solution(model)
 
 """ NEXT MODEL """
@@ -355,6 +409,8 @@ model.dual = pyo.Suffix(
 
 sol_lp = opt.solve(model, tee=True)
 # sol_lp = solver_manager.solve(model, opt = opt)   # using neos
-sol_milp.write()
-model.pprint()
+print(f"obj = {pyo.value(model.obj_cost)}")
+if os.environ.get("VARME_DEBUG"):
+    sol_lp.write()
+    model.pprint()
 print_solution(model)
@@ -12,28 +12,60 @@ A = np.array([
     [0, 7, 4, 0]
 ])
 
+# problem data as plain python containers, used both to initialize the pyomo
+# sets and to precompute the constraint index sets below
+products = ['A', 'B', 'C']
+machines = ['M1', 'M2', 'M3', 'M4']
+
+# products processed on each machine
+K = {
+    'M1': ['A', 'B'],
+    'M2': ['B', 'C'],
+    'M3': ['A', 'C'],
+    'M4': ['A', 'B']
+}
+
+# machine sequence for each product
+S = {
+    'A': ['M1', 'M3', 'M4'],
+    'B': ['M1', 'M2', 'M4'],
+    'C': ['M2', 'M3']
+}
+
+# O(1) lookup structures: membership sets for K and 1-based position maps for
+# S, so no pyomo set intersection or ord() scan is needed during model build
+K_set = {k: set(K[k]) for k in machines}
+ord_S = {j: {m: i + 1 for i, m in enumerate(S[j])} for j in products}
+
+# precompute the index triples that actually produce constraints, instead of
+# letting the rule functions Constraint.Skip their way through the full
+# products x machines x machines cross product
+
+# (j, l, k) where machine l comes before machine k in the sequence of product j
+prod_seq_triples = [
+    (j, l, k)
+    for j in products
+    for l in S[j]
+    for k in S[j]
+    if ord_S[j][l] < ord_S[j][k]
+]
+
+# (i, j, k) for all ordered pairs of distinct products on each machine
+start_seq_triples = [
+    (i, j, k)
+    for i in products
+    for j in products
+    if i != j
+    for k in machines
+]
+
 # =======================================
 # FUNCTIONS
 # =======================================
 
 
-def prod_seq_rule(model, j, l, k):
-
-    if (j in model.K[k].intersection(model.K[l])) and (l != k):
-        if model.S[j].ord(l) < model.S[j].ord(k):
-            return model.t[j, l] + model.tau[j, l] <= model.t[j, k]
-        else:
-            return pyo.Constraint.Skip
-    else:
-        return pyo.Constraint.Skip
-
-
 def start_seq_rule(model, i, j, k):
-
-    if i != j:
-        return model.t[i, k] + model.tau[i, k] <= model.t[j, k] + model.M * (1 - model.x[i, j, k])
-    else:
-        return pyo.Constraint.Skip
+    return model.t[i, k] + model.tau[i, k] <= model.t[j, k] + model.M * (1 - model.x[i, j, k])
 
 
 def print_solution(result_model):
@@ -76,38 +108,48 @@ def print_solution(result_model):
 
 # define sets
 model.products = pyo.Set(
-    initialize = ['A', 'B', 'C']
+    initialize = products
 )
 
 model.machines = pyo.Set(
-    initialize = ['M1', 'M2', 'M3', 'M4']
+    initialize = machines
 )
 
 model.K = pyo.Set(
     model.machines,
-    initialize = {
-        'M1': ['A', 'B'],
-        'M2': ['B', 'C'],
-        'M3': ['A', 'C'],
-        'M4': ['A', 'B']
-    }
+    initialize = K
 )
 
 model.S = pyo.Set(
     model.products,
-    initialize = {
-        'A': ['M1', 'M3', 'M4'],
-        'B': ['M1', 'M2', 'M4'],
-        'C': ['M2', 'M3']
-    }
+    initialize = S
+)
+
+# index sets holding only the triples that produce constraints
+model.start_seq_idx = pyo.Set(
+    initialize = start_seq_triples,
+    dimen = 3
+)
+
+model.prod_seq_idx = pyo.Set(
+    initialize = prod_seq_triples,
+    dimen = 3
 )
 
 # define parameters
+# initialize tau from a dict keyed by (product, machine) - no ord() scans of
+# the pyomo sets during the param build
+tau_init = {
+    (p, m): float(A[i, j])
+    for i, p in enumerate(products)
+    for j, m in enumerate(machines)
+}
+
 model.tau = pyo.Param(
     model.products,
     model.machines,
     domain = pyo.NonNegativeReals,
-    initialize = lambda model, j, k: A[model.products.ord(j)-1, model.machines.ord(k)-1]
+    initialize = tau_init
 )
 
 model.M = pyo.Param(
@@ -137,30 +179,24 @@ model.T = pyo.Var(
 
 # define constraints
 model.con_start_seq = pyo.Constraint(
-    model.products,
-    model.products,
-    model.machines,
+    model.start_seq_idx,
     rule = start_seq_rule
 )
 
 model.con_symmetry = pyo.Constraint(
-    model.products,
-    model.products,
-    model.machines,
-    rule = lambda model, i, j, k: model.x[i, j, k] + model.x[j, i, k] == 1 if i != j else pyo.Constraint.Skip
+    model.start_seq_idx,
+    rule = lambda model, i, j, k: model.x[i, j, k] + model.x[j, i, k] == 1
 )
 
 model.total_time = pyo.Constraint(
     model.products,
     model.machines,
-    rule = lambda model, j, k: model.t[j, k] + model.tau[j, k] <= model.T if j in model.K[k] else pyo.Constraint.Skip
+    rule = lambda model, j, k: model.t[j, k] + model.tau[j, k] <= model.T if j in K_set[k] else pyo.Constraint.Skip
 )
 
 model.prod_seq = pyo.Constraint(
-    model.products,
-    model.machines,
-    model.machines,
-    rule = prod_seq_rule    # use rule function because lambda expression is too long
+    model.prod_seq_idx,
+    rule = lambda model, j, l, k: model.t[j, l] + model.tau[j, l] <= model.t[j, k]
 )
 
 # define objective
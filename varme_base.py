@@ -0,0 +1,368 @@
+# Common blueprint for the Varme unit-commitment scripts.
+#
+# varme.py and varme_modified.py share all sets, parameters, variables, the
+# objective and most constraints - only the demand sense, the consecutive-run
+# limit and the start/stop formulation differ. The shared skeleton is built
+# once into a module-level model and each script takes a clone() of it, then
+# adds its own variant constraints. clone() deep-copies the already-built
+# component tree, which is much cheaper than re-invoking every rule.
+
+import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
+
+# input data from problem definition - the demand over one 5-period schedule,
+# pre-expanded to the full two-schedule range so the param initializes
+# straight from the dict with no rule callback
+_DEMAND_BASE = {
+    1: 50,
+    2: 60,
+    3: 80,
+    4: 70,
+    5: 60
+}
+DEMAND = {j: _DEMAND_BASE[(j-1) % 5 + 1] for j in range(1, 11)}
+
+# length of each time period, also pre-expanded
+TAU = {j: 5 if (j % 5 != 0) else 4 for j in range(1, 11)}
+
+# time period slices used by the objective rules, precomputed once instead of
+# materializing list(model.time_periods)[...] inside every sum expression
+PERIODS = tuple(range(1, 11))
+PERIODS_FIRST6 = PERIODS[:6]
+PERIODS_REPEAT = PERIODS[5:]
+
+# unit limits as plain dicts - used both for the load constraint lambdas
+# (skipping the IndexedParam lookup per call) and for the presolve pass in
+# the scripts
+UNIT_LB = {'M1': 10, 'M2': 12, 'M3': 15}
+UNIT_UB = {'M1': 50, 'M2': 45, 'M3': 55}
+
+# running cost of each power unit k
+RUNNING_COST = {'M1': 2.5, 'M2': 2.5, 'M3': 2.4}
+
+
+# =======================================
+# SHARED RULE FUNCTIONS
+# =======================================
+def rule_con_cyclic(model, k, j):
+    # rule function for cyclic constraint, require each unit state variable x to be the same in con_sequtive schedules.
+    # only indexed over the first schedule, so no Constraint.Skip needed
+    return model.p[k, j] == model.p[k, j+5]
+
+
+def rule_con_warm_start_lb(model, k, j):
+    # rule function for lower bound on warm start constraint, periods j >= 2.
+    # the coefficients are handed to LinearExpression directly so pyomo skips
+    # building the generic sum/monomial expression tree for each small rule
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[1, 1, -2],
+        linear_vars=[model.z[k, j-1], model.y[k, j], model.w[k, j]]
+    ) >= 0
+
+
+def rule_con_warm_start_ub(model, k, j):
+    # rule function for upper bound on warm start constraint, periods j >= 2
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[1, 1, -1],
+        linear_vars=[model.z[k, j-1], model.y[k, j], model.w[k, j]]
+    ) <= 1
+
+
+def rule_obj_init_startcost(model):
+    # rule function for the initial start cost
+    initial_start_cost = pyo.quicksum(
+        (
+           1.5 * model.start_cost[k]
+        )
+        *
+        (
+            pyo.quicksum(
+                model.y[k, j]
+                for j in PERIODS_FIRST6
+            )
+            -
+            pyo.quicksum(
+                model.y[k, j]
+                for j in PERIODS_REPEAT
+            )
+        )
+        for k in model.power_units
+    )
+
+    return initial_start_cost
+
+
+def rule_obj_rep_startcost(model):
+    # rule function for the repeat start cost (warm+cold) in second schedule
+    rep_warm_start_cost = pyo.quicksum(
+            model.w[k, j]
+            * model.start_cost[k]
+            for k in model.power_units
+            for j in PERIODS_REPEAT
+        )
+
+    rep_cold_start_cost = pyo.quicksum(
+            (
+                    pyo.quicksum(model.y[k, j] for j in PERIODS_REPEAT)
+                    - pyo.quicksum(model.w[k, j] for j in PERIODS_REPEAT)
+            )
+            * 1.5
+            * model.start_cost[k]
+            for k in model.power_units
+        )
+
+    return rep_warm_start_cost + rep_cold_start_cost
+
+
+def rule_obj_rep_runcost(model):
+    # rule function for the repeat running cost of all units in second schedule.
+    # cost_coef holds the precomputed tau[j]*running_cost[k] product, so each
+    # term is one param lookup and one multiplication instead of two lookups
+    # and two multiplications through the expression tree
+    run_cost = pyo.quicksum(
+        model.cost_coef[k, j] * model.p[k, j]
+        for k in model.power_units
+        for j in PERIODS_REPEAT
+    )
+
+    return run_cost
+
+
+# =======================================
+# MODEL SKELETON
+# =======================================
+def build_base_model():
+    # build the component tree shared by all script variants: sets, params,
+    # variables, the load/cyclic/start-criteria/warm-start constraints and
+    # the objective. variant-specific constraints (demand sense, consecutive
+    # run limit, start/stop formulation) are added by the scripts themselves
+    model = pyo.ConcreteModel(name="Varme_base")
+
+    # SETS
+    # define the set of power units
+    model.power_units = pyo.Set(
+        initialize=['M1', 'M2', 'M3']
+    )
+
+    # define the set of time periods, for two consecutive schedules of 5 time periods each
+    model.time_periods = pyo.RangeSet(1, 10)
+
+    # index subsets so the constraint rules are only invoked where they actually
+    # produce a constraint, instead of Constraint.Skip'ing half the index space
+    model.first_periods = pyo.RangeSet(1, 5)
+    model.later_periods = pyo.RangeSet(2, 10)
+
+    # warm starts only carry a cost in the repeat schedule, so the warm-start
+    # bookkeeping is only needed there (see the w variable below)
+    model.warm_periods = pyo.RangeSet(6, 10)
+
+    # PARAMETERS
+    # length of each time period
+    model.tau = pyo.Param(
+        model.time_periods,
+        domain=pyo.NonNegativeReals,
+        initialize=TAU
+    )
+
+    # start cost of each power unit k
+    model.start_cost = pyo.Param(
+        model.power_units,
+        domain=pyo.NonNegativeReals,
+        initialize={
+            'M1': 10,
+            'M2': 13,
+            'M3': 16
+        }
+    )
+
+    # running cost of each power unit k
+    model.running_cost = pyo.Param(
+        model.power_units,
+        domain=pyo.NonNegativeReals,
+        initialize=RUNNING_COST
+    )
+
+    # precomputed running cost per period, tau[j]*running_cost[k] - the
+    # objective rule then pays one param lookup per term instead of two
+    model.cost_coef = pyo.Param(
+        model.power_units,
+        model.time_periods,
+        domain=pyo.NonNegativeReals,
+        initialize={(k, j): TAU[j]*RUNNING_COST[k]
+                    for k in RUNNING_COST for j in PERIODS}
+    )
+
+    # power demand in each time period j
+    model.power_demand = pyo.Param(
+        model.time_periods,
+        domain=pyo.NonNegativeReals,
+        initialize=DEMAND
+    )
+
+    # lower bound on power output of each power unit k
+    model.unit_limit_lb = pyo.Param(
+        model.power_units,
+        initialize=UNIT_LB
+    )
+
+    # upper bound on power output of each power unit k
+    model.unit_limit_ub = pyo.Param(
+        model.power_units,
+        initialize=UNIT_UB
+    )
+
+    # VARIABLES
+    # x is a binary variable indicating if power unit k is running in time period j
+    model.x = pyo.Var(
+        model.power_units,
+        model.time_periods,
+        domain=pyo.Binary,
+        initialize=0
+    )
+
+    # real variable power output of unit k in time period j
+    model.p = pyo.Var(
+        model.power_units,
+        model.time_periods,
+        domain=pyo.NonNegativeReals
+    )
+
+    # binary variable y describes if unit k is started in time period j
+    model.y = pyo.Var(
+        model.power_units,
+        model.time_periods,
+        domain=pyo.Binary,
+        initialize=0
+    )
+
+    # variable z describes if unit k is stopped in time period j. the state
+    # transition pins z = y - (x[j] - x[j-1]), which is integral whenever
+    # x and y are, so z can be a relaxed unit-interval variable - one less
+    # binary family for the solver to branch on
+    model.z = pyo.Var(
+        model.power_units,
+        model.time_periods,
+        domain=pyo.UnitInterval,
+        initialize=0
+    )
+
+    # binary variable w describes if unit k is started in time period j as a
+    # warm start. the objective only prices warm starts in the repeat schedule
+    # (j = 6..10) - in the first schedule w is pure bookkeeping with zero
+    # cost, so those variables are fixed to 0 and their defining constraints
+    # dropped, shrinking the MIP by 15 binaries
+    model.w = pyo.Var(
+        model.power_units,
+        model.time_periods,
+        domain=pyo.Binary,
+        initialize=0
+    )
+    for k in model.power_units:
+        for j in model.first_periods:
+            model.w[k, j].fix(0)
+
+    # SHARED CONSTRAINTS
+    # constraint for upper bound on produced power of each unit k in time period j
+    model.con_load_ub = pyo.Constraint(
+        model.power_units,
+        model.time_periods,
+        rule=lambda model, k, j: model.p[k, j] <= model.x[k, j]*UNIT_UB[k]
+    )
+
+    # constraint for lower bound on produced power of each unit k in time period j
+    model.con_load_lb = pyo.Constraint(
+        model.power_units,
+        model.time_periods,
+        rule=lambda model, k, j: model.p[k, j] >= model.x[k, j]*UNIT_LB[k]
+    )
+
+    # constraint to ensure cyclicity of the solution
+    model.con_cyclic = pyo.Constraint(
+        model.power_units,
+        model.first_periods,
+        rule=rule_con_cyclic
+    )
+
+    # constraint to ensure that a unit cannot be started and stopped in the same time period
+    model.con_start_criteria = pyo.Constraint(
+        model.power_units,
+        model.time_periods,
+        rule=lambda model, k, j: model.y[k, j] + model.z[k, j] <= 1
+    )
+
+    # warm start constraint in the first time period - no stop or warm start possible
+    model.con_warm_start_init = pyo.Constraint(
+        model.power_units,
+        rule=lambda model, k: model.z[k, 1] + model.w[k, 1] == 0
+    )
+
+    # warm start constraint, upper bound - only over the repeat schedule,
+    # where w appears in the objective
+    model.con_warm_start_ub = pyo.Constraint(
+        model.power_units,
+        model.warm_periods,
+        rule=rule_con_warm_start_ub
+    )
+
+    # warm start constraint, lower bound
+    model.con_warm_start_lb = pyo.Constraint(
+        model.power_units,
+        model.warm_periods,
+        rule=rule_con_warm_start_lb
+    )
+
+    # OBJECTIVE
+    # define repeat running cost function, deactivate this objective
+    model.obj_rep_runcost = pyo.Objective(
+        rule=rule_obj_rep_runcost,
+        sense=pyo.minimize,
+    )
+    model.obj_rep_runcost.deactivate()
+
+    # define repeat start cost function, deactivate this objective
+    model.obj_rep_startcost = pyo.Objective(
+        rule=rule_obj_rep_startcost,
+        sense=pyo.minimize
+    )
+    model.obj_rep_startcost.deactivate()
+
+    # define initial start cost function, dectivate this objective
+    model.obj_init_startcost = pyo.Objective(
+        rule=rule_obj_init_startcost,
+        sense=pyo.minimize
+    )
+    model.obj_init_startcost.deactivate()
+
+    # define objective function to minimize total cost
+    model.obj_cost = pyo.Objective(
+        expr=(
+            model.obj_init_startcost.expr
+            +model.obj_rep_startcost.expr
+            +model.obj_rep_runcost.expr
+        ),
+        sense=pyo.minimize
+    )
+
+    return model
+
+
+# blueprint built once at import; the scripts clone it instead of paying the
+# full rule-callback cost again
+_BASE_MODEL = build_base_model()
+
+
+def get_base_model(name):
+    # return a fresh deep copy of the blueprint for one script variant
+    model = _BASE_MODEL.clone()
+    model.name = name
+    return model
+
+
+# one solver instance shared by every script variant. constructing a
+# SolverFactory re-resolves the solver and re-parses options each time; the
+# appsi interface is also persistent, so reusing the instance keeps the
+# in-memory solver problem warm across the MILP solve and the fixed LP
+# resolve (and across variants when several run in one process)
+OPT = pyo.SolverFactory('appsi_highs')
@@ -0,0 +1,122 @@
+# linopy variant of the Varme unit-commitment model from varme.py.
+# linopy builds each constraint block as one vectorized xarray expression
+# instead of invoking a python rule per (unit, period) index, so the model
+# build allocates a handful of arrays rather than one expression tree node
+# per index tuple. varme.py remains the pyomo reference formulation.
+
+import linopy
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+# ======================================
+# DATA
+# ======================================
+
+# power units and time periods (two consecutive schedules of 5 periods each)
+units = pd.Index(['M1', 'M2', 'M3'], name='unit')
+periods = pd.RangeIndex(1, 11, name='time')
+first5 = periods[:5]
+first6 = periods[:6]
+repeat5 = periods[5:]
+
+# demand repeats over the two schedules
+demand = xr.DataArray(
+    np.tile([50, 60, 80, 70, 60], 2), coords=[periods], name='power_demand'
+)
+
+# length of each time period
+tau = xr.DataArray(
+    [5 if j % 5 != 0 else 4 for j in periods], coords=[periods], name='tau'
+)
+
+# unit cost and limit data
+start_cost = xr.DataArray([10, 13, 16], coords=[units], name='start_cost')
+running_cost = xr.DataArray([2.5, 2.5, 2.4], coords=[units], name='running_cost')
+unit_limit_lb = xr.DataArray([10, 12, 15], coords=[units], name='unit_limit_lb')
+unit_limit_ub = xr.DataArray([50, 45, 55], coords=[units], name='unit_limit_ub')
+
+# ======================================
+# MODEL
+# ======================================
+
+m = linopy.Model()
+
+# x: unit running, y: unit started, z: unit stopped, w: warm start
+x = m.add_variables(binary=True, coords=[units, periods], name='x')
+y = m.add_variables(binary=True, coords=[units, periods], name='y')
+z = m.add_variables(binary=True, coords=[units, periods], name='z')
+w = m.add_variables(binary=True, coords=[units, periods], name='w')
+
+# power output of unit k in period j
+p = m.add_variables(lower=0, coords=[units, periods], name='p')
+
+# ======================================
+# CONSTRAINTS
+# ======================================
+
+# power output limits while running
+m.add_constraints(p <= x*unit_limit_ub, name='con_load_ub')
+m.add_constraints(p >= x*unit_limit_lb, name='con_load_lb')
+
+# total production equals demand in each period
+m.add_constraints(p.sum('unit') == demand, name='con_demand')
+
+# cyclicity: power output repeats between the two schedules
+p_second = p.sel(time=repeat5)
+p_second = p_second.assign_coords(time=p_second.coords['time'] - 5)
+m.add_constraints(p.sel(time=first5) == p_second, name='con_cyclic')
+
+# no unit runs more than 3 consecutive periods: every window of 4 periods
+# starting in the first schedule holds at most 3 running periods
+consec = sum(
+    x.shift(time=-i).sel(time=first5) for i in range(4)
+)
+m.add_constraints(consec <= 3, name='con_consec')
+
+# start/stop bookkeeping: x[j] - x[j-1] bounded by y[j] - z[j]
+dx = x.sel(time=periods[1:]) - x.shift(time=1).sel(time=periods[1:])
+m.add_constraints(dx >= (y - z).sel(time=periods[1:]), name='con_start_lb')
+m.add_constraints(dx <= (y - z).sel(time=periods[1:]), name='con_start_ub')
+
+# first period: running means started
+m.add_constraints(x.sel(time=1) == y.sel(time=1), name='con_start_init')
+
+# a unit cannot be started and stopped in the same period
+m.add_constraints(y + z <= 1, name='con_start_criteria')
+
+# warm start requires a stop in the previous period and a start now
+zy = z.shift(time=1).sel(time=periods[1:]) + y.sel(time=periods[1:])
+m.add_constraints(zy >= 2*w.sel(time=periods[1:]), name='con_warm_start_lb')
+m.add_constraints(zy <= 1 + w.sel(time=periods[1:]), name='con_warm_start_ub')
+
+# no stop or warm start in the first period
+m.add_constraints(z.sel(time=1) + w.sel(time=1) == 0, name='con_warm_start_init')
+
+# ======================================
+# OBJECTIVE
+# ======================================
+
+# initial cold start cost: starts in the first schedule that are not repeats
+init_startcost = (1.5*start_cost*(y.sel(time=first6).sum('time')
+                                  - y.sel(time=repeat5).sum('time'))).sum()
+
+# repeat start cost in the second schedule: warm starts at full cost, the
+# remaining (cold) starts at 1.5x
+rep_startcost = (start_cost*w.sel(time=repeat5).sum('time')
+                 + 1.5*start_cost*(y.sel(time=repeat5).sum('time')
+                                   - w.sel(time=repeat5).sum('time'))).sum()
+
+# repeat running cost in the second schedule
+rep_runcost = (running_cost*(tau*p).sel(time=repeat5).sum('time')).sum()
+
+m.add_objective(init_startcost + rep_startcost + rep_runcost)
+
+# ======================================
+# SOLVE THE MILP
+# ======================================
+
+m.solve(solver_name='highs')
+
+print(f'Total cost: {m.objective.value} kkr')
+print(m.solution)
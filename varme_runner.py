@@ -0,0 +1,24 @@
+# run the three unit-commitment script variants concurrently. the variants
+# are independent models (varme, varme_modified and the homework copy), so
+# there is nothing to share between solves - one worker process per script.
+# processes rather than threads because the pyomo model build is pure python
+# and threads would serialize on the GIL, same approach as beer_pyomo_rules.py
+
+import runpy
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPTS = ['varme.py', 'varme_modified.py', 'homework3_copy.py']
+
+
+def run_script(path):
+    # each worker executes one script top to bottom in its own interpreter,
+    # exactly as if it were run standalone
+    runpy.run_path(path, run_name='__main__')
+    return path
+
+
+if __name__ == '__main__':
+    with ProcessPoolExecutor(max_workers=len(SCRIPTS)) as executor:
+        futures = [executor.submit(run_script, path) for path in SCRIPTS]
+        for future in futures:
+            print(f'finished {future.result()}')